@@ -3,6 +3,10 @@
 import numpy as np
 from pyspinw.dimensionality import dimensionality_check
 
+# Fallback directions for degenerate inputs, allocated once rather than per call
+_Y_AXIS = np.array([0.0, 1.0, 0.0])
+_Z_AXIS = np.array([0.0, 0.0, 1.0])
+
 @dimensionality_check(vectors=(-1, 3))
 def find_aligned_basis(vectors: np.ndarray, rcond: float | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """ Find a set of orthonormal basis vectors aligned with the first being aligned to the input vectors
@@ -15,31 +19,35 @@ def find_aligned_basis(vectors: np.ndarray, rcond: float | None = None) -> tuple
         rcond = 3*np.finfo(vectors.dtype).eps # N * floating point epsilon
 
     # Lengths, for checking for zeros and for normalising
-    lengths = np.sqrt(np.sum(vectors**2, axis=1))
+    lengths = np.linalg.norm(vectors, axis=1)
 
     #
     # First basis vector will is just a normalised version of the input
     #
 
-    # Avoid zero divisions by using np.divide instead of /
-    zero_vectors = lengths < rcond
-    e_1 = np.divide(vectors, lengths.reshape(-1, 1), where=~zero_vectors.reshape(-1, 1))
-
-    # Assign zero vectors to z
-    e_1[zero_vectors, :] = np.array([[0.0,0.0,1.0]])
+    # Avoid zero divisions by dividing zero vectors by one, then select z for them
+    zero_vectors = (lengths < rcond).reshape(-1, 1)
+    safe_lengths = np.where(zero_vectors, 1.0, lengths.reshape(-1, 1))
+    e_1 = vectors / safe_lengths
+    np.copyto(e_1, _Z_AXIS, where=zero_vectors) # copyto keeps the input dtype, np.where would promote it
 
     #
-    # Second basis, cross with x-axis vector, unless its pointing that way already, then we choose y-axis explicitly
+    # Second basis, cross with x-axis vector, unless its pointing along +/-x already, then we choose y-axis explicitly
     #
 
-    x_aligned = np.abs(e_1[:, 0] - 1) < rcond
+    # The cross product with x only vanishes when the y and z components do, so test its length, not e_1x
+    x_aligned = (np.hypot(e_1[:, 1], e_1[:, 2]) < rcond).reshape(-1, 1)
+
+    # e_1 cross x = (0, e_1z, -e_1y), written directly rather than calling np.cross
+    e_2 = np.empty_like(e_1)
+    e_2[:, 0] = 0.0
+    e_2[:, 1] = e_1[:, 2]
+    np.negative(e_1[:, 1], out=e_2[:, 2])
 
-    x_vectors = np.zeros_like(vectors)
-    x_vectors[:, 0] = 1.0
+    np.copyto(e_2, _Y_AXIS, where=x_aligned)
 
-    e_2 = np.cross(e_1, x_vectors)
-    e_2[x_aligned, :] = np.array([[0.0, 1.0, 0.0]])
-    e_2 /= np.sqrt(np.sum(e_2**2, axis=1)).reshape(-1, 1) # Normalise this one
+    # Normalise, e_2 is always perpendicular to x, so only the y and z components contribute to the length
+    e_2 /= np.hypot(e_2[:, 1], e_2[:, 2]).reshape(-1, 1)
 
     #
     # Third basis, just the cross of the first two
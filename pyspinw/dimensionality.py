@@ -69,10 +69,17 @@ def dimensionality_check(**kwargs):
                 raise TypeError("Constraints must be int or str, got "
                                 f"{keyword}.shape[{dimension}] constraint of type {type(size)}")
 
+    # Symbols that only appear once can never be violated, so only keep the ones that relate several dimensions
+    equality_groups: list[tuple[str, tuple[tuple[str, int], ...]]] = [
+        (symbol, tuple(entries)) for symbol, entries in equalities.items() if len(entries) > 1]
+
+    # The constraints are fully known here, so turn them into a single function with the checks written out
+    check = _compile_check(sizes, constants, equality_groups)
+
     def decorator(fun: Callable) -> Callable:
 
-        # grab the argument names
-        variable_names = fun.__code__.co_varnames
+        # grab the positional argument names once, co_varnames also lists local variables after these
+        variable_names = fun.__code__.co_varnames[:fun.__code__.co_argcount]
 
         @functools.wraps(fun)
         def wrapper(*args, **kwargs):
@@ -81,44 +88,7 @@ def dimensionality_check(**kwargs):
             all_args = dict(zip(variable_names, args))
             all_args.update(**kwargs)
 
-            # Check the sizes, and the type while were at it
-            for name, size in sizes:
-
-                if name not in all_args:
-                    raise ValueError(f"The numpy array required ('{name}') was not given")
-
-                data = all_args[name]
-
-                if isinstance(data, np.ndarray):
-                    if not len(data.shape) == size:
-                        raise DimensionalityError(f"Expected '{name}' to be a {size}D tensor, "
-                                                  f"but it is {len(data.shape)}D")
-                else:
-                    raise TypeError(f"Argument '{name}' is not a numpy array, but is {type(data)}")
-
-            # Check all the constant values
-            for name, dimension, size in constants:
-                data = all_args[name]
-                # We have already checked that it's an array and for correct len(shape), so resolving
-                # this should not throw
-
-                if not data.shape[dimension] == size:
-                    raise DimensionalityError(f"Dimension {dimension} of '{name}' is not {size}. "
-                                              f"Got {data.shape[dimension]}")
-
-            # Check all the equalities
-            for symbol in equalities:
-                size = None
-                for name, dimension in equalities[symbol]:
-                    data = all_args[name]
-                    # Again, the validity of this should be checked in len(shape) loop
-                    if size is None:
-                        size = data.shape[dimension]
-                    else:
-                        if not size == data.shape[dimension]:
-                            message_details = ", ".join([f"{name}:{index}" for name, index in equalities[symbol]])
-                            raise DimensionalityError(f"Tensor dimensions specified by '{symbol}' do not all match "
-                                                      f"({message_details})")
+            check(all_args)
 
             # if all these have passed then we're peachy
 
@@ -127,3 +97,62 @@ def dimensionality_check(**kwargs):
         return wrapper
 
     return decorator
+
+
+def _compile_check(sizes: list[tuple[str, int]],
+                   constants: list[tuple[str, int, int]],
+                   equality_groups: list[tuple[str, tuple[tuple[str, int], ...]]]) -> Callable[[dict], None]:
+    """ Generate a function that checks a dictionary of arguments against the given constraints
+
+    The checks are written out as straight-line code (one `if` per constraint) rather than interpreted
+    from the constraint lists on every call. They are made in the same order as the lists: presence, type and
+    number of dimensions for each array, then fixed sizes, then equalities.
+
+    :param sizes: variable names and the required len(shape)
+    :param constants: variable names, dimensions and the required size of that dimension
+    :param equality_groups: symbols and the (variable name, dimension) pairs that must all be equal
+    """
+
+    # Variables are referred to by position in the generated code, names are only ever used inside string literals
+    local_names = {name: f"arg_{index}" for index, (name, _) in enumerate(sizes)}
+
+    lines = ["def check(all_args):"]
+
+    # Check the sizes, and the type while were at it
+    for name, size in sizes:
+        var = local_names[name]
+        missing_message = f"The numpy array required ('{name}') was not given"
+        type_message = f"Argument '{name}' is not a numpy array, but is "
+        size_message = f"Expected '{name}' to be a {size}D tensor, but it is "
+        lines += [
+            f"    if {name!r} not in all_args:",
+            f"        raise ValueError({missing_message!r})",
+            f"    {var} = all_args[{name!r}]",
+            f"    if not isinstance({var}, ndarray):",
+            f"        raise TypeError({type_message!r} + str(type({var})))",
+            f"    if not {var}.ndim == {size}:",
+            f"        raise DimensionalityError({size_message!r} + str({var}.ndim) + 'D')"]
+
+    # Check all the constant values
+    for name, dimension, size in constants:
+        var = local_names[name]
+        constant_message = f"Dimension {dimension} of '{name}' is not {size}. Got "
+        lines += [
+            f"    if not {var}.shape[{dimension}] == {size}:",
+            f"        raise DimensionalityError({constant_message!r} + str({var}.shape[{dimension}]))"]
+
+    # Check all the equalities
+    for symbol, entries in equality_groups:
+        chain = " == ".join(f"{local_names[name]}.shape[{dimension}]" for name, dimension in entries)
+        message_details = ", ".join([f"{name}:{index}" for name, index in entries])
+        equality_message = f"Tensor dimensions specified by '{symbol}' do not all match ({message_details})"
+        lines += [
+            f"    if not {chain}:",
+            f"        raise DimensionalityError({equality_message!r})"]
+
+    lines.append("    return None")
+
+    namespace = {"ndarray": np.ndarray, "DimensionalityError": DimensionalityError}
+    exec(compile("\n".join(lines), "<dimensionality_check>", "exec"), namespace) # pylint: disable=exec-used
+
+    return namespace["check"]
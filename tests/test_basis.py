@@ -16,6 +16,8 @@ test_vectors = [rng.normal(size=(n, 3)) for n in input_lengths]
 
 test_vectors.append(np.eye(3)) # Basis aligned unit vectors
 test_vectors.append(10*np.eye(3)) # Basis aligned non-unit vectors
+test_vectors.append(-np.eye(3)) # Negatively basis aligned vectors, -x needs special treatment
+test_vectors.append(np.array([[1, 1e-9, 0], [-1, 1e-9, 0], [-1, 0, 1e-12]])) # Close to, but not on, +/-x
 
 acceptable_tolerance = 10*np.finfo(float).eps
 
@@ -76,3 +78,12 @@ def test_find_aligned_basis_zero_is_z():
     assert np.all(e3[:, 0] == -1)
     assert np.all(e3[:, 1] == 0)
     assert np.all(e3[:, 2] == 0)
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_find_aligned_basis_dtype(dtype):
+    """ Check the output has the same precision as the input, including for the zero vector special case """
+
+    vectors = np.concatenate((np.eye(3), np.zeros((1, 3)), [[5, 5, 5]])).astype(dtype)
+
+    for basis_vector in find_aligned_basis(vectors):
+        assert basis_vector.dtype == dtype
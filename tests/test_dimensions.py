@@ -316,3 +316,42 @@ def test_omission(a, b):
     else:
         with pytest.raises(DimensionalityError):
             omission(x, y)
+
+#
+# Error messages, the checks are generated as code, so make sure unusual names and symbols survive that
+#
+
+@dimensionality_check(x=("it's", 3), y=("it's", 3))
+def quoted_symbol(x, y):
+    """ Symbol containing a quote character """
+
+def test_error_messages():
+    """ Check the error messages contain the offending names and sizes """
+
+    with pytest.raises(DimensionalityError, match="Dimension 1 of 'x' is not 3. Got 4"):
+        quoted_symbol(np.zeros((2, 4)), np.zeros((2, 3)))
+
+    with pytest.raises(DimensionalityError,
+                       match=r"Tensor dimensions specified by 'it's' do not all match \(x:0, y:0\)"):
+        quoted_symbol(np.zeros((2, 3)), np.zeros((5, 3)))
+
+    with pytest.raises(DimensionalityError, match="Expected 'y' to be a 2D tensor, but it is 1D"):
+        quoted_symbol(np.zeros((2, 3)), np.zeros((3,)))
+
+    with pytest.raises(TypeError, match="Argument 'x' is not a numpy array"):
+        quoted_symbol([[0, 0, 0]], np.zeros((1, 3)))
+
+#
+# Argument binding, only parameters can be checked, not local variables
+#
+
+@dimensionality_check(x=(3,))
+def local_named_x(a, *rest):
+    """ Checks 'x', which is a local variable, not a parameter """
+    x = a
+    return x, rest
+
+def test_local_variable_not_bound():
+    """ Surplus positional arguments must not be matched against local variable names """
+    with pytest.raises(ValueError, match="was not given"):
+        local_named_x(np.zeros((2,)), np.zeros((5,)), np.zeros((3,)))